@@ -5,6 +5,8 @@ This package provides a clean interface for extracting content from different fi
 including documents, images, audio files, and data files.
 """
 
+from typing import Iterable
+
 from .message_creator import InputMessageCreator
 from .constants import MessageTypes, Roles
 from .extractors import ExtractorRegistry
@@ -20,11 +22,25 @@ __all__ = [
     "FileUtils",
     "FileOrganizer",
     "create_message_from_file",
+    "acreate_message_from_file",
+    "acreate_messages_from_files",
     "is_supported_file",
     "organize_directory"
 ]
 
 
+# Shared creator used by the convenience functions below
+_creator = None
+
+
+def _get_creator() -> InputMessageCreator:
+    """Get the shared InputMessageCreator, creating it on first use."""
+    global _creator
+    if _creator is None:
+        _creator = InputMessageCreator()
+    return _creator
+
+
 # Convenience functions for quick file processing
 def create_message_from_file(file_path: str):
     """
@@ -36,8 +52,54 @@ def create_message_from_file(file_path: str):
     Returns:
         Structured message in the specified format
     """
-    creator = InputMessageCreator()
-    return creator.create_message(file_path)
+    return _get_creator().create_message(file_path)
+
+
+async def acreate_message_from_file(file_path: str):
+    """
+    Async variant of create_message_from_file.
+    
+    The file is read in a worker thread so the event loop is not blocked.
+    
+    Args:
+        file_path: Path to the file to process
+        
+    Returns:
+        Structured message in the specified format
+    """
+    # asyncio is imported here so importing the package does not pay for it
+    import asyncio
+    
+    return await asyncio.to_thread(create_message_from_file, file_path)
+
+
+async def acreate_messages_from_files(file_paths: Iterable[str], concurrency: int = 8):
+    """
+    Create structured messages for several files concurrently.
+    
+    Args:
+        file_paths: Paths to the files to process
+        concurrency: Maximum number of files read at the same time
+        
+    Returns:
+        List of structured messages, in the same order as file_paths
+        
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
+    import asyncio
+    
+    # Bound the number of parallel reads to avoid thrashing slow disks
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def create_one(file_path: str):
+        async with semaphore:
+            return await acreate_message_from_file(file_path)
+    
+    return await asyncio.gather(*(create_one(file_path) for file_path in file_paths))
 
 
 def is_supported_file(file_path: str) -> bool:
@@ -50,8 +112,7 @@ def is_supported_file(file_path: str) -> bool:
     Returns:
         True if supported, False otherwise
     """
-    creator = InputMessageCreator()
-    return creator.is_supported_format(file_path)
+    return _get_creator().is_supported_format(file_path)
 
 
 def organize_directory(source_dir: str, target_dir: str = None, use_ai: bool = True, **kwargs):
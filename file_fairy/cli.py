@@ -6,12 +6,16 @@ File Fairy CLI - AI-powered file organization tool
 
 import sys
 import argparse
+import heapq
+import time
 from pathlib import Path
+from typing import Optional
 
 # Import file_fairy modules
 try:
     from .core.organizer import FileOrganizer
     from .core.config import AppConfig, FileCategory
+    from .core.file_utils import FileUtils
 except ImportError as e:
     print(f"Error: Failed to import file_fairy package: {e}")
     print("Please ensure file_fairy is available in your Python path.")
@@ -21,15 +25,18 @@ except ImportError as e:
 class FileFairyCLI:
     """Command-line interface for File Fairy."""
     
-    def __init__(self):
+    def __init__(self, config: Optional[AppConfig] = None):
         """Initialize the CLI."""
+        self.config = config or AppConfig.load()
         self.organizer = None
     
     def _initialize_organizer(self, use_ai: bool = True, model_path: str = None) -> FileOrganizer:
         """Initialize the file organizer with given parameters."""
         if not self.organizer:
-            config = AppConfig.load()
-            self.organizer = FileOrganizer(use_ai=use_ai, model_path=model_path, config=config)
+            # main() runs behind a __main__ guard, so spawned extraction workers are safe
+            self.organizer = FileOrganizer(
+                use_ai=use_ai, model_path=model_path, config=self.config, parallel_extraction=True
+            )
         return self.organizer
     
     def organize_files(self, args) -> None:
@@ -60,8 +67,10 @@ class FileFairyCLI:
                     return
                 
                 print(f"\nShowing preview for first {len(preview)} files:\n")
-                for item in preview:
-                    print(f"  📄 {item['original_name']} → {item['new_name']} ({item['category']})")
+                print("\n".join(
+                    f"  📄 {item['original_name']} → {item['new_name']} ({item['category']})"
+                    for item in preview
+                ))
                 
                 print(f"\n💡 Use 'file-fairy organize {args.target_path}' to apply changes.")
             
@@ -86,8 +95,7 @@ class FileFairyCLI:
                 
                 if results['errors']:
                     print("\n❌ Errors encountered:")
-                    for error in results['errors']:
-                        print(f"  • {error}")
+                    print("\n".join(f"  • {error}" for error in results['errors']))
                 
                 if args.dry_run:
                     print("\n💧 This was a dry run. No files were actually moved.")
@@ -109,10 +117,8 @@ class FileFairyCLI:
         
         print(f"📊 Analyzing '{args.target_path}'...")
         
-        from .core.file_utils import FileUtils
-        
         # Get files
-        files = FileUtils.get_files_in_directory(args.target_path, recursive=args.recursive)
+        files = FileUtils(self.config).get_files_in_directory(args.target_path, recursive=args.recursive)
         
         if not files:
             print("No files found for analysis.")
@@ -129,18 +135,23 @@ class FileFairyCLI:
                 ext_count[ext] = ext_count.get(ext, 0) + 1
             
             sorted_exts = sorted(ext_count.items(), key=lambda x: x[1], reverse=True)
+            lines = []
             for ext, count in sorted_exts:
                 category = FileCategory.get_category_for_extension(ext) if ext != 'no_extension' else '기타'
-                print(f"  {ext:>10} : {count:>3} files ({category})")
+                lines.append(f"  {ext:>10} : {count:>3} files ({category})")
+            # Write the whole table at once instead of one write per extension
+            print("\n".join(lines))
         
         # Date analysis
         if args.by_date or not (args.by_ext or args.by_date):
-            import datetime
             print("\n--- Oldest Files (Top 10) ---")
-            files_by_date = sorted(files, key=lambda f: f.stat().st_mtime)
-            for file in files_by_date[:10]:
-                mod_time = datetime.datetime.fromtimestamp(file.stat().st_mtime)
-                print(f"  {mod_time.strftime('%Y-%m-%d %H:%M')} : {file.name}")
+            # Stat each file once and keep only the ten oldest instead of sorting all
+            oldest_files = heapq.nsmallest(10, ((file.stat().st_mtime, file) for file in files),
+                                           key=lambda item: item[0])
+            print("\n".join(
+                f"  {time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime))} : {file.name}"
+                for mtime, file in oldest_files
+            ))
     
     def show_info(self, args) -> None:
         """
@@ -172,18 +183,17 @@ class FileFairyCLI:
                     print(f"  {category}: {extensions}")
         
         if args.model_path or not (args.supported_formats or args.categories or args.model_path):
-            config = AppConfig.load()
-            print(f"\n🤖 Default AI Model Path: {config.ai.model_path}")
-            model_path = Path(config.ai.model_path)
+            print(f"\n🤖 Default AI Model Path: {self.config.ai.model_path}")
+            model_path = Path(self.config.ai.model_path)
             if model_path.exists():
                 print("  ✅ Model directory found")
             else:
                 print("  ❌ Model directory not found (AI features will be disabled)")
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser(config: Optional[AppConfig] = None) -> argparse.ArgumentParser:
     """Create the command line argument parser."""
-    config = AppConfig.load()
+    config = config or AppConfig.load()
     
     parser = argparse.ArgumentParser(
         prog="file-fairy",
@@ -231,10 +241,12 @@ def create_parser() -> argparse.ArgumentParser:
 
 def main():
     """Main CLI entry point."""
-    parser = create_parser()
+    # Load configuration once and share it between the parser and the commands
+    config = AppConfig.load()
+    parser = create_parser(config)
     args = parser.parse_args()
     
-    cli = FileFairyCLI()
+    cli = FileFairyCLI(config)
     
     try:
         if args.command == "organize":
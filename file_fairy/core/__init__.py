@@ -2,6 +2,7 @@
 
 from .config import AppConfig, AIConfig, CategoryConfig, FileCategory
 from .file_utils import FileUtils
+from .ai_cache import AIResultCache
 from .organizer import FileOrganizer
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "FileCategory",
     "FileUtils", 
     "FileOrganizer",
+    "AIResultCache",
 ]
@@ -0,0 +1,111 @@
+"""Content-addressable cache for AI analysis results."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class AIResultCache:
+    """Disk-backed cache of AI responses keyed by file content, model and task."""
+    
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+    
+    @staticmethod
+    def compute_file_digest(file_path: Path) -> str:
+        """
+        Compute the SHA-256 digest of a file's contents.
+        
+        The file is streamed through hashlib's C read loop in fixed-size chunks,
+        so large files are hashed without being held in memory.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Hex digest of the file contents
+        """
+        with open(file_path, 'rb') as file:
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    # The file is read once from start to end, so ask for
+                    # aggressive read-ahead on cold caches
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            return hashlib.file_digest(file, 'sha256').hexdigest()
+    
+    @staticmethod
+    def make_key(task: str, model: str, file_name: str, file_digest: str) -> str:
+        """
+        Build a cache key from the inputs that determine an AI response.
+        
+        Args:
+            task: Name of the AI task
+            model: Model identifier
+            file_name: Original filename shown to the model
+            file_digest: Digest of the file contents
+            
+        Returns:
+            Hex cache key
+        """
+        hasher = hashlib.sha256()
+        for part in (task, model, file_name, file_digest):
+            encoded = part.encode('utf-8')
+            # Length-prefix each part so different splits cannot collide
+            hasher.update(len(encoded).to_bytes(8, 'little'))
+            hasher.update(encoded)
+        return hasher.hexdigest()
+    
+    def _get_entry_path(self, key: str) -> Path:
+        """Get the entry file for a key, sharded by its first two hex characters."""
+        return self.cache_dir / key[:2] / f"{key[2:]}.json"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            Cached response, or None on a miss
+        """
+        try:
+            with open(self._get_entry_path(key), 'r', encoding='utf-8') as file:
+                return json.load(file)['value']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def put(self, key: str, value: str, task: str, model: str) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key from make_key
+            value: Response to store
+            task: Name of the AI task
+            model: Model identifier
+        """
+        entry_path = self._get_entry_path(key)
+        temp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        entry = {'task': task, 'model': model, 'value': value, 'ts': time.time()}
+        
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file, ensure_ascii=False)
+            # Publish atomically so readers never see a partial entry
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # The cache is an optimization; failing to write it is not an error
+            temp_path.unlink(missing_ok=True)
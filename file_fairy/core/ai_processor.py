@@ -1,14 +1,36 @@
+import hashlib
 import re
-from llama_cpp import Llama
+import threading
 from pathlib import Path
 from typing import Optional
 
+from ..utils import _REPEATED_UNDERSCORES_PATTERN, _UNSAFE_FILENAME_CHARS_TABLE
+
+
+# 응답 파싱에 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+_KEYWORD_LABEL_PATTERN = re.compile(r'키워드\s*:\s*\[?([^\]\n]+)\]?', re.IGNORECASE)
+_FOLDER_LABEL_PATTERN = re.compile(r'폴더\s*:\s*\[?([^\]\n]+)\]?', re.IGNORECASE)
+_FILENAME_PATTERN = re.compile(r'([a-zA-Z가-힣0-9_]+\.[a-zA-Z0-9]+)')
+_UNSAFE_LABEL_CHARS = re.compile(r'[<>:"/\\|?*\[\]]')
+
+# 프롬프트에 넣는 파일 내용의 최대 길이 (문자 수로 먼저 자른 뒤 토큰 수로 제한)
+_MAX_CONTENT_CHARS = 2000
+_MAX_CONTENT_TOKENS = 1024
+
+# 무의미한 키워드 필터링 목록
+_MEANINGLESS_KEYWORDS = frozenset({"없음", "비어있음", "알수없음", "모름", "정보없음", "내용없음", "빈내용"})
+
 
 class AIKeywordExtractor:
     """
     Llama-cpp를 사용한 AI 키워드 추출 및 파일 분류 클래스
     """
     
+    # 생성 실패 시 반환되는 응답 (캐시하지 않음)
+    GENERATION_FAILED_RESPONSE = "응답_생성_실패"
+    PROCESSING_FAILED_RESPONSE = "키워드: 분석실패\n폴더: 기타"
+    FAILED_RESPONSES = (GENERATION_FAILED_RESPONSE, PROCESSING_FAILED_RESPONSE)
+    
     def __init__(self, model_path: str, prompt_template: Optional[str] = None):
         """
         AI 모델을 초기화합니다.
@@ -32,6 +54,8 @@ class AIKeywordExtractor:
             
         self.prompt_template = prompt_template or self._get_default_prompt_template()
         self.model = None
+        # 여러 FileOrganizer가 같은 모델을 공유하므로 생성 호출을 직렬화
+        self._model_lock = threading.RLock()
         
         # 모델 초기화
         self._load_model()
@@ -81,24 +105,29 @@ File content:
             if not self.model_path.exists():
                 raise FileNotFoundError(f"모델 파일을 찾을 수 없습니다: {self.model_path}")
             
+            # llama_cpp는 무거우므로 실제로 모델을 로드할 때만 import
+            # (CLI --help, --no-ai 실행, 추출 워커 프로세스는 import 비용을 치르지 않음)
+            from llama_cpp import Llama
+            
+            model_options = {
+                'model_path': str(self.model_path),
+                'n_ctx': 4096,  # Context window size
+                'n_gpu_layers': -1,  # Use all GPU layers (-1 for all)
+                'n_batch': 512,  # Prompt tokens evaluated per batch
+                'use_mmap': True,  # 가중치를 복사하지 않고 페이지 캐시를 프로세스 간 공유
+                'verbose': False,
+            }
+            
             # Llama 모델 로드 (에러 처리 개선)
             try:
                 self.model = Llama(
-                    model_path=str(self.model_path),
-                    n_ctx=4096,  # Context window size
-                    n_gpu_layers=-1,  # Use all GPU layers (-1 for all)
-                    verbose=False,
+                    **model_options,
                     chat_format="gemma"  # Gemma 모델용 chat format
                 )
             except Exception as model_error:
                 # chat_format 없이 재시도
                 print("⚠️  Gemma chat format 실패, 기본 설정으로 재시도...")
-                self.model = Llama(
-                    model_path=str(self.model_path),
-                    n_ctx=4096,
-                    n_gpu_layers=-1,
-                    verbose=False
-                )
+                self.model = Llama(**model_options)
             
             print("✅ Llama-cpp 모델 로딩 완료!")
             
@@ -119,21 +148,22 @@ File content:
         """
         try:
             # Llama-cpp를 사용한 chat completion
-            response = self.model.create_chat_completion(
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_new_tokens,
-                temperature=0,  # 낮은 temperature로 일관성 있는 결과
-                stop=["<eos>", "</s>", "\n\n"]  # 적절한 중단점 설정
-            )
+            with self._model_lock:
+                response = self.model.create_chat_completion(
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_new_tokens,
+                    temperature=0,  # 낮은 temperature로 일관성 있는 결과
+                    stop=["<eos>", "</s>", "\n\n"]  # 적절한 중단점 설정
+                )
             
             result = response['choices'][0]['message']['content'].strip()
             return result
             
         except Exception as e:
             print(f"응답 생성 중 오류: {e}")
-            return "응답_생성_실패"
+            return self.GENERATION_FAILED_RESPONSE
     
     def generate_response(self, prompt: str, max_tokens: int = 64) -> str:
         """
@@ -141,29 +171,117 @@ File content:
         """
         return self._generate_response(prompt, max_tokens)
     
-    def process_file_content(self, file_name: str, file_content: str) -> str:
+    def _generate_structured_response(self, prompt: str, max_new_tokens: int = 64) -> str:
+        """
+        키워드/폴더 응답을 스트리밍으로 생성하고, 두 줄이 완성되면 즉시 중단합니다.
+        
+        Args:
+            prompt: 입력 프롬프트
+            max_new_tokens: 최대 생성 토큰 수
+            
+        Returns:
+            생성된 응답 텍스트
+        """
+        try:
+            chunks = []
+            with self._model_lock:
+                stream = self.model.create_chat_completion(
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_new_tokens,
+                    temperature=0,
+                    stop=["<eos>", "</s>", "\n\n"],
+                    stream=True
+                )
+                try:
+                    for chunk in stream:
+                        content = chunk['choices'][0]['delta'].get('content')
+                        if not content:
+                            continue
+                        chunks.append(content)
+                        # 줄바꿈이 나온 경우에만 완성된 줄을 확인
+                        if '\n' in content and self._has_complete_answer(''.join(chunks)):
+                            break
+                finally:
+                    # 모델 잠금을 해제하기 전에 생성을 정리
+                    stream.close()
+            
+            return ''.join(chunks).strip()
+            
+        except Exception as e:
+            print(f"응답 생성 중 오류: {e}")
+            return self.GENERATION_FAILED_RESPONSE
+    
+    @staticmethod
+    def _has_complete_answer(text: str) -> bool:
+        """완성된 줄 중에 키워드와 폴더 줄이 모두 있는지 확인합니다."""
+        complete_lines = [line.strip() for line in text.split('\n')[:-1]]
+        # 응답 파서와 같은 정규식을 줄 시작에 맞춰 사용 ("키워드 : ..." 도 인식)
+        return (any(_KEYWORD_LABEL_PATTERN.match(line) for line in complete_lines)
+                and any(_FOLDER_LABEL_PATTERN.match(line) for line in complete_lines))
+    
+    def get_prompt_fingerprint(self) -> str:
+        """
+        모델에 보내는 입력을 결정하는 설정(프롬프트 템플릿, 내용 길이 제한)의 해시를 반환합니다.
+        
+        캐시 키에 포함시켜 이 설정이 바뀌면 이전에 캐시된 응답을 재사용하지 않도록 합니다.
+        """
+        fingerprint_source = f"{_MAX_CONTENT_CHARS}\0{_MAX_CONTENT_TOKENS}\0{self.prompt_template}"
+        return hashlib.sha256(fingerprint_source.encode('utf-8')).hexdigest()[:16]
+    
+    def process_file_content(self, file_name: str, file_content: str, max_tokens: int = 64) -> str:
         """
         Process file content to get AI suggestions for naming and categorization.
         
         Args:
             file_name: Original filename
             file_content: File content to analyze
+            max_tokens: Maximum number of tokens to generate
             
         Returns:
             AI response with keywords and folder suggestions
         """
         try:
-            # Use the default prompt template to get structured response
+            # Use the default prompt template to get structured response.
+            # The fixed instructions come first so llama.cpp can reuse their
+            # evaluated prefix from the previous call; only the tail is new.
             prompt = self.prompt_template.format(
                 file_name=file_name,
-                file_content=file_content[:2000]  # Limit content length
+                file_content=self._truncate_content(file_content)
             )
             
-            return self.generate_response(prompt)
+            return self._generate_structured_response(prompt, max_tokens)
             
         except Exception as e:
             print(f"파일 내용 처리 중 오류: {e}")
-            return "키워드: 분석실패\n폴더: 기타"
+            return self.PROCESSING_FAILED_RESPONSE
+    
+    def _truncate_content(self, file_content: str) -> str:
+        """
+        파일 내용을 프롬프트에 넣을 길이로 자릅니다.
+        
+        문자 수 제한만으로는 한글처럼 문자당 토큰이 많은 내용이 컨텍스트를
+        과도하게 차지하므로, 모델 토크나이저 기준 토큰 수로도 제한합니다.
+        
+        Args:
+            file_content: 파일 내용
+            
+        Returns:
+            잘린 파일 내용
+        """
+        file_content = file_content[:_MAX_CONTENT_CHARS]
+        try:
+            # 공유 모델을 사용하므로 토크나이저 호출도 생성과 같은 잠금으로 보호
+            with self._model_lock:
+                tokens = self.model.tokenize(file_content.encode('utf-8'), add_bos=False)
+                if len(tokens) <= _MAX_CONTENT_TOKENS:
+                    return file_content
+                truncated = self.model.detokenize(tokens[:_MAX_CONTENT_TOKENS])
+            return truncated.decode('utf-8', errors='ignore')
+        except Exception:
+            # 토크나이저를 쓸 수 없으면 문자 수 제한만 적용
+            return file_content
     
     def extract_keywords(self, file_content: str, file_name: str, image_path: Optional[str] = None, audio_path: Optional[str] = None) -> str:
         """
@@ -323,8 +441,8 @@ OUTPUT FORMAT:
                 new_filename += extension
             
             # 파일명으로 적합하지 않은 문자 제거
-            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', new_filename)
-            safe_filename = re.sub(r'_+', '_', safe_filename).strip('_')
+            safe_filename = new_filename.translate(_UNSAFE_FILENAME_CHARS_TABLE)
+            safe_filename = _REPEATED_UNDERSCORES_PATTERN.sub('_', safe_filename).strip('_')
             
             # 파일명이 너무 길면 자르기
             name_part = safe_filename.replace(extension, '')
@@ -345,15 +463,12 @@ OUTPUT FORMAT:
     def _parse_keywords_from_response(self, response: str) -> str:
         """AI 응답에서 키워드를 파싱합니다."""
         try:
-            # 무의미한 키워드 필터링 목록
-            meaningless_keywords = {"없음", "비어있음", "알수없음", "모름", "정보없음", "내용없음", "빈내용"}
-            
             # "키워드:" 라벨 찾기 - 새로운 파일명 형식 지원
-            keyword_match = re.search(r'키워드\s*:\s*\[?([^\]\n]+)\]?', response, re.IGNORECASE)
+            keyword_match = _KEYWORD_LABEL_PATTERN.search(response)
             if keyword_match:
                 keywords = keyword_match.group(1).strip()
                 # 특수문자 정리 (대괄호 제거, 파일명에 적합하지 않은 문자)
-                keywords = re.sub(r'[<>:"/\\|?*\[\]]', '', keywords)
+                keywords = _UNSAFE_LABEL_CHARS.sub('', keywords)
                 
                 # 완전한 파일명 형식인지 확인 (확장자 포함)
                 if '.' in keywords and not keywords.startswith('.'):
@@ -362,7 +477,7 @@ OUTPUT FORMAT:
                 
                 # 키워드 형식인 경우 무의미한 키워드 필터링
                 keyword_parts = [k.strip() for k in keywords.split('_') if k.strip()]
-                filtered_parts = [k for k in keyword_parts if k not in meaningless_keywords]
+                filtered_parts = [k for k in keyword_parts if k not in _MEANINGLESS_KEYWORDS]
                 
                 if len(filtered_parts) >= 1:  # 최소 1개 이상의 의미있는 키워드가 있을 때 반환
                     return '_'.join(filtered_parts)
@@ -372,7 +487,7 @@ OUTPUT FORMAT:
             for line in lines:
                 if '키워드' in line and ':' in line:
                     keywords = line.split(':', 1)[1].strip()
-                    keywords = re.sub(r'[<>:"/\\|?*\[\]]', '', keywords)
+                    keywords = _UNSAFE_LABEL_CHARS.sub('', keywords)
                     if keywords:
                         # 완전한 파일명 형식인지 확인
                         if '.' in keywords and not keywords.startswith('.'):
@@ -380,13 +495,13 @@ OUTPUT FORMAT:
                         
                         # 키워드 형식인 경우 무의미한 키워드 필터링
                         keyword_parts = [k.strip() for k in keywords.split('_') if k.strip()]
-                        filtered_parts = [k for k in keyword_parts if k not in meaningless_keywords]
+                        filtered_parts = [k for k in keyword_parts if k not in _MEANINGLESS_KEYWORDS]
                         
                         if len(filtered_parts) >= 1:
                             return '_'.join(filtered_parts)
             
             # 응답에서 파일명 패턴을 직접 찾기 시도
-            filename_pattern = re.search(r'([a-zA-Z가-힣0-9_]+\.[a-zA-Z0-9]+)', response)
+            filename_pattern = _FILENAME_PATTERN.search(response)
             if filename_pattern:
                 return filename_pattern.group(1)
             
@@ -399,11 +514,11 @@ OUTPUT FORMAT:
         """AI 응답에서 폴더명을 파싱합니다."""
         try:
             # "폴더:" 라벨 찾기
-            folder_match = re.search(r'폴더\s*:\s*\[?([^\]\n]+)\]?', response, re.IGNORECASE)
+            folder_match = _FOLDER_LABEL_PATTERN.search(response)
             if folder_match:
                 folder_name = folder_match.group(1).strip()
                 # 폴더명으로 적합하지 않은 문자 제거
-                folder_name = re.sub(r'[<>:"/\\|?*\[\]]', '', folder_name)
+                folder_name = _UNSAFE_LABEL_CHARS.sub('', folder_name)
                 return folder_name
             
             # 대체 패턴들 시도
@@ -411,7 +526,7 @@ OUTPUT FORMAT:
             for line in lines:
                 if '폴더' in line and ':' in line:
                     folder_name = line.split(':', 1)[1].strip()
-                    folder_name = re.sub(r'[<>:"/\\|?*\[\]]', '', folder_name)
+                    folder_name = _UNSAFE_LABEL_CHARS.sub('', folder_name)
                     if folder_name:
                         return folder_name
             
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -37,10 +37,7 @@ class FileCategory(Enum):
         if not extension.startswith('.'):
             extension = f'.{extension}'
         
-        for category in cls:
-            if extension in category.extensions:
-                return category.korean_name
-        return cls.OTHER.korean_name
+        return _EXTENSION_TO_CATEGORY.get(extension, cls.OTHER.korean_name)
     
     @classmethod
     def get_categories_dict(cls) -> Dict[str, List[str]]:
@@ -48,6 +45,14 @@ class FileCategory(Enum):
         return {cat.korean_name: cat.extensions for cat in cls}
 
 
+# Extension to category name lookup; the first category listing an extension wins
+_EXTENSION_TO_CATEGORY: Dict[str, str] = {}
+for _category in FileCategory:
+    for _extension in _category.extensions:
+        _EXTENSION_TO_CATEGORY.setdefault(_extension, _category.korean_name)
+del _category, _extension
+
+
 @dataclass
 class AIConfig:
     """AI-related configuration."""
@@ -55,6 +60,8 @@ class AIConfig:
     max_tokens: int = 64
     enable_vision: bool = True
     enable_audio: bool = True
+    enable_cache: bool = True
+    cache_dir: str = '~/.cache/file-fairy'  # Expanded by the organizer
     
     @classmethod
     def from_env(cls) -> 'AIConfig':
@@ -63,7 +70,9 @@ class AIConfig:
             model_path=os.getenv('FILE_FAIRY_MODEL_PATH', cls.model_path),
             max_tokens=int(os.getenv('FILE_FAIRY_MAX_TOKENS', str(cls.max_tokens))),
             enable_vision=os.getenv('FILE_FAIRY_ENABLE_VISION', 'true').lower() == 'true',
-            enable_audio=os.getenv('FILE_FAIRY_ENABLE_AUDIO', 'true').lower() == 'true'
+            enable_audio=os.getenv('FILE_FAIRY_ENABLE_AUDIO', 'true').lower() == 'true',
+            enable_cache=os.getenv('FILE_FAIRY_ENABLE_CACHE', 'true').lower() == 'true',
+            cache_dir=os.getenv('FILE_FAIRY_CACHE_DIR', cls.cache_dir)
         )
 
 
@@ -83,7 +92,7 @@ class AppConfig:
     log_file: str = "file_fairy.log"
     exclude_patterns: List[str] = field(default_factory=lambda: [
         '.git', '.DS_Store', 'node_modules', 'venv', '__pycache__',
-        'Thumbs.db', '.vscode', '.idea', 'file_fairy.log'
+        'Thumbs.db', '.vscode', '.idea', 'file_fairy.log', '.fairy_state.json'
     ])
     ai: AIConfig = field(default_factory=AIConfig)
     categories: CategoryConfig = field(default_factory=CategoryConfig)
@@ -96,7 +105,7 @@ class AppConfig:
             ai=AIConfig.from_env(),
         )
     
-    def should_exclude(self, path: Path) -> bool:
+    def should_exclude(self, path: Union[str, Path]) -> bool:
         """Check if path should be excluded."""
         path_str = str(path)
         return any(pattern in path_str for pattern in self.exclude_patterns)
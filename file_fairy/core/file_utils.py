@@ -6,6 +6,15 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 from .config import AppConfig
+from ..utils import _UNSAFE_FILENAME_CHARS_TABLE
+
+
+# Device names that cannot be used as filenames on Windows
+_RESERVED_FILENAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
 
 
 class FileUtils:
@@ -30,11 +39,25 @@ class FileUtils:
             return []
         
         files = []
-        pattern = "**/*" if recursive else "*"
+        pending = [directory]
         
-        for path in directory.glob(pattern):
-            if path.is_file() and not self.config.should_exclude(path):
-                files.append(path)
+        # Walk with os.scandir so file/directory checks reuse the d_type
+        # reported by the directory listing instead of a stat() per entry
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Every path below an excluded directory contains its
+                            # path, so prune it instead of walking node_modules etc.
+                            if recursive and not self.config.should_exclude(entry.path):
+                                pending.append(entry.path)
+                        elif entry.is_file() and not self.config.should_exclude(entry.path):
+                            files.append(Path(entry.path))
+            except OSError:
+                # Skip unreadable directories, as glob() did
+                continue
         
         return sorted(files)
     
@@ -49,30 +72,61 @@ class FileUtils:
         directory.mkdir(parents=True, exist_ok=True)
     
     @staticmethod
-    def move_file(source: Path, destination: Path) -> bool:
+    def move_file(source: Path, destination: Path, create_parent: bool = True) -> bool:
         """
         Move a file from source to destination.
         
         Args:
             source: Source file path
             destination: Destination file path
+            create_parent: Whether to create the destination directory first;
+                callers that already created it can skip the extra mkdir
             
         Returns:
             True if successful, False otherwise
         """
+        return FileUtils.move_file_to_unique_path(source, destination, create_parent) is not None
+    
+    @staticmethod
+    def move_file_to_unique_path(source: Path, destination: Path, create_parent: bool = True) -> Optional[Path]:
+        """
+        Move a file, renaming it to a numbered variant if the destination is taken.
+        
+        Args:
+            source: Source file path
+            destination: Preferred destination file path
+            create_parent: Whether to create the destination directory first
+            
+        Returns:
+            The path the file was moved to, or None if the move failed
+        """
         try:
             # Create destination directory if needed
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            if create_parent:
+                destination.parent.mkdir(parents=True, exist_ok=True)
             
-            # Handle file name conflicts
+            # Claim a free name atomically; link() fails instead of overwriting
+            linked_destination = FileUtils._link_to_unique_filename(source, destination)
+            if linked_destination is not None:
+                try:
+                    os.unlink(source)
+                except OSError:
+                    # Source is locked or read-only; drop the new link so the
+                    # file is not left in both places
+                    os.unlink(linked_destination)
+                    raise
+                return linked_destination
+            
+            # Hard links are unavailable (e.g. across filesystems); fall back
+            # to checking for conflicts before moving
             if destination.exists():
                 destination = FileUtils._get_unique_filename(destination)
             
             shutil.move(str(source), str(destination))
-            return True
+            return destination
         except Exception as e:
             print(f"Error moving file {source} to {destination}: {e}")
-            return False
+            return None
     
     @staticmethod
     def copy_file(source: Path, destination: Path) -> bool:
@@ -100,6 +154,30 @@ class FileUtils:
             print(f"Error copying file {source} to {destination}: {e}")
             return False
     
+    @staticmethod
+    def _link_to_unique_filename(source: Path, destination: Path) -> Optional[Path]:
+        """
+        Hard-link source to destination, or to the first free numbered variant.
+        
+        Args:
+            source: Source file path
+            destination: Preferred destination file path
+            
+        Returns:
+            The linked path, or None if hard links are not supported here
+        """
+        candidate = destination
+        counter = 1
+        while True:
+            try:
+                os.link(source, candidate, follow_symlinks=False)
+                return candidate
+            except FileExistsError:
+                candidate = destination.parent / f"{destination.stem}_{counter}{destination.suffix}"
+                counter += 1
+            except (OSError, NotImplementedError):
+                return None
+    
     @staticmethod
     def _get_unique_filename(file_path: Path) -> Path:
         """
@@ -162,14 +240,8 @@ class FileUtils:
             return False
         
         # Check for reserved names on Windows
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-        
         name_without_ext = Path(filename).stem.upper()
-        if name_without_ext in reserved_names:
+        if name_without_ext in _RESERVED_FILENAMES:
             return False
         
         return True
@@ -185,12 +257,8 @@ class FileUtils:
         Returns:
             Sanitized filename
         """
-        # Replace unsafe characters with underscores
-        unsafe_chars = '<>:"/\\|?*'
-        sanitized = filename
-        
-        for char in unsafe_chars:
-            sanitized = sanitized.replace(char, '_')
+        # Replace unsafe characters with underscores in a single pass
+        sanitized = filename.translate(_UNSAFE_FILENAME_CHARS_TABLE)
         
         # Remove leading/trailing dots and spaces
         sanitized = sanitized.strip('. ')
@@ -1,19 +1,102 @@
 """File organizer with AI-powered categorization and naming."""
 
+import json
 import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Iterator, Optional, Set, Tuple, Any
 
 from .config import AppConfig
 from .file_utils import FileUtils
 from .ai_processor import AIKeywordExtractor
+from .ai_cache import AIResultCache
 from ..message_creator import InputMessageCreator
+from ..extractors.base import BaseExtractor
+
+
+# Loaded AI models shared by every organizer, keyed by model path
+_AI_EXTRACTORS: Dict[str, AIKeywordExtractor] = {}
+_AI_EXTRACTORS_LOCK = threading.Lock()
+
+# Upper bound on worker processes used to extract file contents
+_MAX_EXTRACTION_WORKERS = 8
+
+# Files prepared ahead of the one being analyzed, per extraction worker
+_LOOKAHEAD_PER_WORKER = 2
+
+# Message creator owned by each extraction worker process
+_worker_message_creator: Optional[InputMessageCreator] = None
+
+
+def _get_ai_extractor(model_path: str) -> AIKeywordExtractor:
+    """Get the AI extractor for a model, loading the model only on first use."""
+    with _AI_EXTRACTORS_LOCK:
+        ai_extractor = _AI_EXTRACTORS.get(model_path)
+        if ai_extractor is None:
+            ai_extractor = AIKeywordExtractor(model_path=model_path)
+            _AI_EXTRACTORS[model_path] = ai_extractor
+        return ai_extractor
+
+
+def _init_extraction_worker() -> None:
+    """Create the message creator once per extraction worker process."""
+    global _worker_message_creator
+    _worker_message_creator = InputMessageCreator()
+
+
+def _prepare_file_worker(
+    file_path: str,
+    cache_dir: Optional[str],
+    cache_task: str,
+    model_id: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Hash a file and extract its content inside an extraction worker process.
+    
+    Args:
+        file_path: Path to the file
+        cache_dir: AI cache directory, or None if caching is disabled
+        cache_task: Task name used in cache keys
+        model_id: Model identifier used in cache keys
+        
+    Returns:
+        Tuple of (cache_key, file_content); file_content is None when a cached
+        AI response already exists
+    """
+    cache_key = None
+    if cache_dir is not None:
+        file_digest = AIResultCache.compute_file_digest(Path(file_path))
+        cache_key = AIResultCache.make_key(
+            cache_task, model_id, Path(file_path).name, file_digest
+        )
+        if AIResultCache(Path(cache_dir)).get(cache_key) is not None:
+            return cache_key, None
+    
+    message = _worker_message_creator.create_message(file_path)
+    return cache_key, FileOrganizer._get_message_text(message)
 
 
 class FileOrganizer:
     """Main file organizer class with AI capabilities."""
     
-    def __init__(self, use_ai: bool = True, model_path: Optional[str] = None, config: Optional[AppConfig] = None):
+    # Task name used to key cached AI suggestions
+    AI_SUGGESTION_TASK = "file_suggestions"
+    
+    # File in the target directory recording the files already organized there
+    STATE_FILE_NAME = ".fairy_state.json"
+    
+    def __init__(
+        self,
+        use_ai: bool = True,
+        model_path: Optional[str] = None,
+        config: Optional[AppConfig] = None,
+        parallel_extraction: bool = False,
+        ai_extractor: Optional[AIKeywordExtractor] = None
+    ):
         """
         Initialize the File Organizer.
         
@@ -21,18 +104,31 @@ class FileOrganizer:
             use_ai: Whether to enable AI features
             model_path: Path to AI model directory
             config: Application configuration
+            parallel_extraction: Whether to extract file contents in a process pool.
+                Worker processes are spawned and re-import the main module, so only
+                enable this when it is guarded by ``if __name__ == "__main__":``.
+            ai_extractor: Already loaded AI extractor to use instead of loading
+                (or reusing) the shared model for model_path
         """
         self.config = config or AppConfig.load()
         self.use_ai = use_ai
+        self.parallel_extraction = parallel_extraction
+        if model_path is None and ai_extractor is not None:
+            model_path = str(ai_extractor.model_path)
         self.model_path = model_path or self.config.ai.model_path
-        self.ai_extractor: Optional[AIKeywordExtractor] = None
+        self.ai_extractor: Optional[AIKeywordExtractor] = ai_extractor
+        self.ai_cache: Optional[AIResultCache] = (
+            AIResultCache(Path(self.config.ai.cache_dir).expanduser()) if self.config.ai.enable_cache else None
+        )
         self.message_creator = InputMessageCreator()
         self.file_utils = FileUtils(self.config)
+        # Target directories already created during the current run
+        self._created_directories: Set[Path] = set()
         
         # Setup logging
         self._setup_logging()
         
-        if self.use_ai:
+        if self.use_ai and self.ai_extractor is None:
             self._initialize_ai()
     
     def _setup_logging(self) -> None:
@@ -63,7 +159,7 @@ class FileOrganizer:
                 return False
             
             self.logger.info("🧠 Initializing Gemma ONNX model...")
-            self.ai_extractor = AIKeywordExtractor(model_path=str(model_path_obj))
+            self.ai_extractor = _get_ai_extractor(str(model_path_obj.resolve()))
             self.logger.info("✅ AI model loaded successfully!")
             return True
             
@@ -94,6 +190,7 @@ class FileOrganizer:
             raise FileNotFoundError(f"Source directory not found: {source_dir}")
         
         self.logger.info(f"Starting organization of: {source_dir}")
+        self._created_directories.clear()
         
         files = self.file_utils.get_files_in_directory(source_dir, recursive=True)
         results = {
@@ -104,12 +201,27 @@ class FileOrganizer:
             'moved_files': []
         }
         
+        # Skip files an earlier run already moved into the target directory
+        state = self._load_state(target_dir)
+        target_root = os.path.abspath(target_dir)
+        files_to_organize = []
         for file_path in files:
+            if self._is_already_organized(file_path, target_root, state):
+                results['skipped_files'] += 1
+            else:
+                files_to_organize.append(file_path)
+        
+        for file_path, cache_key, file_content in self._iter_prepared_files(files_to_organize):
             try:
-                result = self._organize_single_file(file_path, target_dir, dry_run)
+                result = self._organize_single_file(
+                    file_path, target_dir, dry_run, file_content, cache_key
+                )
                 if result['success']:
                     results['processed_files'] += 1
                     results['moved_files'].append(result)
+                    if not dry_run:
+                        state.pop(self._get_state_key(file_path, target_root), None)
+                        self._record_organized_file(Path(result['target_path']), target_root, state)
                 else:
                     results['skipped_files'] += 1
                     if result.get('error'):
@@ -120,16 +232,212 @@ class FileOrganizer:
                 results['errors'].append(error_msg)
                 results['skipped_files'] += 1
         
+        if not dry_run and results['processed_files']:
+            self._save_state(target_dir, state)
+        
         self.logger.info(f"Organization complete. Processed: {results['processed_files']}, "
                         f"Skipped: {results['skipped_files']}, Errors: {len(results['errors'])}")
         
         return results
     
+    def _load_state(self, target_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the record of files already organized into a target directory.
+        
+        Args:
+            target_dir: Target directory for organized files
+            
+        Returns:
+            Dictionary mapping paths relative to target_dir to their recorded state
+        """
+        try:
+            with open(target_dir / self.STATE_FILE_NAME, 'r', encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+    
+    def _save_state(self, target_dir: Path, state: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write the record of files organized into a target directory.
+        
+        Args:
+            target_dir: Target directory for organized files
+            state: Dictionary mapping relative paths to their recorded state
+        """
+        state_path = target_dir / self.STATE_FILE_NAME
+        temp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(state, file, ensure_ascii=False)
+            os.replace(temp_path, state_path)
+        except OSError as e:
+            self.logger.warning(f"Could not save organization state to {state_path}: {e}")
+            temp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _get_state_key(file_path: Path, target_root: str) -> Optional[str]:
+        """
+        Get the state key of a file, or None if it is outside the target directory.
+        
+        Args:
+            file_path: Path to the file
+            target_root: Absolute path of the target directory
+            
+        Returns:
+            Path of the file relative to the target directory, in POSIX form
+        """
+        try:
+            relative_path = os.path.relpath(os.path.abspath(file_path), target_root)
+        except ValueError:
+            # Different drives on Windows
+            return None
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return None
+        return Path(relative_path).as_posix()
+    
+    def _is_already_organized(
+        self,
+        file_path: Path,
+        target_root: str,
+        state: Dict[str, Dict[str, Any]]
+    ) -> bool:
+        """
+        Check whether a file was organized by an earlier run and has not changed since.
+        
+        Args:
+            file_path: Path to the file
+            target_root: Absolute path of the target directory
+            state: Dictionary mapping relative paths to their recorded state
+            
+        Returns:
+            True if the file can be skipped, False otherwise
+        """
+        if not state:
+            return False
+        
+        entry = state.get(self._get_state_key(file_path, target_root))
+        if not isinstance(entry, dict):
+            return False
+        
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            return False
+        return entry.get('mtime_ns') == file_stat.st_mtime_ns and entry.get('size') == file_stat.st_size
+    
+    def _record_organized_file(
+        self,
+        moved_path: Path,
+        target_root: str,
+        state: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Record a file that was moved into the target directory.
+        
+        Args:
+            moved_path: Path the file was moved to
+            target_root: Absolute path of the target directory
+            state: Dictionary mapping relative paths to their recorded state
+        """
+        state_key = self._get_state_key(moved_path, target_root)
+        if state_key is None:
+            return
+        
+        try:
+            file_stat = moved_path.stat()
+        except OSError:
+            return
+        state[state_key] = {'mtime_ns': file_stat.st_mtime_ns, 'size': file_stat.st_size}
+    
+    def _iter_prepared_files(
+        self,
+        files: List[Path]
+    ) -> Iterator[Tuple[Path, Optional[str], Optional[str]]]:
+        """
+        Yield files in order together with their AI cache key and extracted content.
+        
+        When AI and parallel extraction are enabled, supported files are hashed and
+        parsed in a process pool a few files ahead of the consumer, so extraction
+        overlaps with the serial model inference done on the files already yielded.
+        Files whose preparation fails in a worker are yielded without a key or
+        content and handled serially.
+        
+        Args:
+            files: Files about to be organized
+            
+        Yields:
+            Tuples of (file_path, cache_key, file_content)
+        """
+        pending_files = []
+        if self.use_ai and self.ai_extractor and self.parallel_extraction:
+            pending_files = [
+                file_path for file_path in files
+                if self.message_creator.is_supported_format(str(file_path))
+            ]
+        
+        if len(pending_files) < 2:
+            for file_path in files:
+                yield file_path, None, None
+            return
+        
+        max_workers = min(os.cpu_count() or 1, _MAX_EXTRACTION_WORKERS, len(pending_files))
+        cache_dir = str(self.ai_cache.cache_dir) if self.ai_cache is not None else None
+        cache_task = self._get_cache_task()
+        model_id = self._get_cache_model_id()
+        files_to_submit = iter(pending_files)
+        submitted = deque()
+        
+        try:
+            # Spawn fresh workers so the loaded model is never forked
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_extraction_worker
+            )
+        except (OSError, NotImplementedError) as e:
+            self.logger.warning(f"Parallel extraction unavailable, extracting serially: {e}")
+            for file_path in files:
+                yield file_path, None, None
+            return
+        
+        with executor:
+            for file_path in files:
+                # Keep a bounded window of files being prepared ahead of this one
+                while len(submitted) < max_workers * _LOOKAHEAD_PER_WORKER:
+                    next_file = next(files_to_submit, None)
+                    if next_file is None:
+                        break
+                    try:
+                        future = executor.submit(
+                            _prepare_file_worker, str(next_file), cache_dir, cache_task, model_id
+                        )
+                    except BrokenExecutor as e:
+                        # Remaining files are prepared serially by the consumer
+                        self.logger.warning(f"Parallel extraction stopped, extracting serially: {e}")
+                        files_to_submit = iter(())
+                        break
+                    submitted.append((next_file, future))
+                
+                if not submitted or submitted[0][0] != file_path:
+                    yield file_path, None, None
+                    continue
+                
+                _, future = submitted.popleft()
+                try:
+                    cache_key, file_content = future.result()
+                except Exception as e:
+                    self.logger.debug(f"Parallel extraction failed for {file_path}: {e}")
+                    cache_key, file_content = None, None
+                yield file_path, cache_key, file_content
+    
     def _organize_single_file(
         self, 
         file_path: Path, 
         target_dir: Path, 
-        dry_run: bool = False
+        dry_run: bool = False,
+        file_content: Optional[str] = None,
+        cache_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Organize a single file.
@@ -138,6 +446,8 @@ class FileOrganizer:
             file_path: Path to the file to organize
             target_dir: Target directory for organized files
             dry_run: If True, only show what would be done
+            file_content: Previously extracted content, if available
+            cache_key: Previously computed AI cache key, if available
             
         Returns:
             Dictionary with organization result
@@ -145,7 +455,7 @@ class FileOrganizer:
         try:
             # Get category and new filename
             if self.use_ai and self.ai_extractor:
-                category, new_filename = self._get_ai_suggestions(file_path)
+                category, new_filename = self._get_ai_suggestions(file_path, file_content, cache_key)
             else:
                 category = self._get_basic_category(file_path)
                 new_filename = file_path.name
@@ -169,12 +479,19 @@ class FileOrganizer:
                 self.logger.info(f"[DRY RUN] Would move {file_path} -> {target_file_path}")
                 return result
             
+            # Create each category directory once rather than once per file
+            if target_category_dir not in self._created_directories:
+                target_category_dir.mkdir(parents=True, exist_ok=True)
+                self._created_directories.add(target_category_dir)
+            
             # Actually move the file
-            success = FileUtils.move_file(file_path, target_file_path)
-            result['success'] = success
+            moved_path = FileUtils.move_file_to_unique_path(file_path, target_file_path, create_parent=False)
+            result['success'] = moved_path is not None
             
-            if success:
-                self.logger.info(f"Moved: {file_path} -> {target_file_path}")
+            if moved_path is not None:
+                # Report the final name, which may be a numbered variant
+                result['target_path'] = str(moved_path)
+                self.logger.info(f"Moved: {file_path} -> {moved_path}")
             else:
                 result['error'] = f"Failed to move {file_path}"
                 self.logger.error(result['error'])
@@ -188,12 +505,19 @@ class FileOrganizer:
                 'error': str(e)
             }
     
-    def _get_ai_suggestions(self, file_path: Path) -> Tuple[str, str]:
+    def _get_ai_suggestions(
+        self,
+        file_path: Path,
+        file_content: Optional[str] = None,
+        cache_key: Optional[str] = None
+    ) -> Tuple[str, str]:
         """
         Get AI-powered category and filename suggestions.
         
         Args:
             file_path: Path to the file
+            file_content: Previously extracted content, if available
+            cache_key: Previously computed AI cache key, if available
             
         Returns:
             Tuple of (category, suggested_filename)
@@ -201,13 +525,8 @@ class FileOrganizer:
         try:
             # Extract file content if supported
             if self.message_creator.is_supported_format(str(file_path)):
-                # Get file content for AI analysis
-                file_content = self._extract_file_content(file_path)
-                # Get AI suggestions
-                suggestions = self.ai_extractor.process_file_content(
-                    file_name=file_path.name,
-                    file_content=file_content
-                )
+                # Get AI suggestions, reusing earlier results for identical files
+                suggestions = self._get_ai_response(file_path, file_content, cache_key)
                 
                 # Parse AI response
                 category, filename = self._parse_ai_suggestions(suggestions)
@@ -219,6 +538,101 @@ class FileOrganizer:
         # Fallback to basic categorization
         return self._get_basic_category(file_path), file_path.name
     
+    def _get_ai_response(
+        self,
+        file_path: Path,
+        file_content: Optional[str] = None,
+        cache_key: Optional[str] = None
+    ) -> str:
+        """
+        Get the raw AI response for a file, using the result cache when enabled.
+        
+        Args:
+            file_path: Path to the file
+            file_content: Previously extracted content, if available
+            cache_key: Previously computed AI cache key, if available
+            
+        Returns:
+            Raw AI response
+        """
+        if cache_key is None:
+            cache_key = self._get_cache_key(file_path)
+        if cache_key is not None:
+            cached_response = self.ai_cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+        
+        # Get file content for AI analysis
+        if file_content is None:
+            file_content = self._extract_file_content(file_path)
+        response = self.ai_extractor.process_file_content(
+            file_name=file_path.name,
+            file_content=file_content,
+            max_tokens=self.config.ai.max_tokens
+        )
+        
+        # Responses to extraction error text would outlive installing the missing
+        # dependency or fixing the extractor, so only cache real content
+        if (
+            cache_key is not None
+            and response not in AIKeywordExtractor.FAILED_RESPONSES
+            and not BaseExtractor.is_error_message(file_content)
+        ):
+            self.ai_cache.put(cache_key, response, self._get_cache_task(), self._get_cache_model_id())
+        
+        return response
+    
+    def _get_cache_key(self, file_path: Path) -> Optional[str]:
+        """
+        Get the AI cache key for a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Cache key, or None if caching is disabled or the file cannot be hashed
+        """
+        if self.ai_cache is None:
+            return None
+        
+        try:
+            file_digest = AIResultCache.compute_file_digest(file_path)
+        except OSError as e:
+            self.logger.warning(f"Could not hash {file_path} for the AI cache: {e}")
+            return None
+        
+        return AIResultCache.make_key(
+            self._get_cache_task(), self._get_cache_model_id(), file_path.name, file_digest
+        )
+    
+    def _get_cache_model_id(self) -> str:
+        """
+        Get the model identifier used in cache keys.
+        
+        It names the model file actually loaded (a configured directory resolves to
+        the .gguf inside it) together with its size and modification time, so a
+        different or replaced model never reuses another model's suggestions.
+        """
+        model_file = Path(self.ai_extractor.model_path).resolve()
+        try:
+            model_stat = model_file.stat()
+        except OSError:
+            return str(model_file)
+        return f"{model_file}:{model_stat.st_size}:{model_stat.st_mtime_ns}"
+    
+    def _get_cache_task(self) -> str:
+        """
+        Get the cache task name.
+        
+        It includes the generation length limit and a fingerprint of the prompt
+        template and content limits, so changing what the model sees or how much
+        it may generate does not return responses cached under the old settings.
+        """
+        return (
+            f"{self.AI_SUGGESTION_TASK}:max_tokens={self.config.ai.max_tokens}"
+            f":prompt={self.ai_extractor.get_prompt_fingerprint()}"
+        )
+    
     def _extract_file_content(self, file_path: Path) -> str:
         """
         Extract content from a file for AI analysis.
@@ -231,14 +645,26 @@ class FileOrganizer:
         """
         try:
             message = self.message_creator.create_message(str(file_path))
-            # Extract text content from message
-            texts = [item['text'] for item in message[0]['content'] 
-                    if item.get('type') == 'text' and 'text' in item]
-            return texts[1] if len(texts) > 1 else ""
+            return self._get_message_text(message)
         except Exception as e:
             self.logger.warning(f"Content extraction failed for {file_path}: {e}")
             return ""
     
+    @staticmethod
+    def _get_message_text(message: List[Dict[str, Any]]) -> str:
+        """
+        Get the extracted file text from a message.
+        
+        Args:
+            message: Message built by InputMessageCreator
+            
+        Returns:
+            Extracted content as string
+        """
+        texts = [item['text'] for item in message[0]['content'] 
+                if item.get('type') == 'text' and 'text' in item]
+        return texts[1] if len(texts) > 1 else ""
+    
     def _parse_ai_suggestions(self, ai_response: str) -> Tuple[str, str]:
         """
         Parse AI response to extract category and filename.
@@ -313,8 +739,6 @@ class FileOrganizer:
                     'path': str(file_path)
                 })
                 
-                print(f"🔥 Preview: {file_path.name} -> {new_filename} in category '{category}'")
-                
             except Exception as e:
                 self.logger.warning(f"Preview failed for {file_path}: {e}")
         
@@ -1,39 +1,70 @@
 """Extractor registry and factory."""
 
-from typing import Dict, Type
+from importlib import import_module
+from typing import Dict, Type, Union
 
 from .base import BaseExtractor
-from .text_extractor import PlainTextExtractor
-from .pdf_extractor import PDFExtractor
-from .office_extractors import DOCXExtractor, PPTXExtractor
-from .hwp_extractor import HWPExtractor
-from .data_extractors import CSVExtractor, JSONExtractor, ExcelExtractor
+
+
+# Extractor classes exposed by this package, mapped to the module defining them.
+# Modules are imported on first use so that processing one file type does not
+# pay the import cost of every other extractor.
+_EXTRACTOR_MODULES: Dict[str, str] = {
+    'PlainTextExtractor': '.text_extractor',
+    'PDFExtractor': '.pdf_extractor',
+    'DOCXExtractor': '.office_extractors',
+    'PPTXExtractor': '.office_extractors',
+    'HWPExtractor': '.hwp_extractor',
+    'CSVExtractor': '.data_extractors',
+    'JSONExtractor': '.data_extractors',
+    'ExcelExtractor': '.data_extractors',
+}
+
+
+def _load_extractor_class(class_name: str) -> Type[BaseExtractor]:
+    """Import and return an extractor class by name."""
+    module = import_module(_EXTRACTOR_MODULES[class_name], __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    """Resolve extractor classes lazily on attribute access (PEP 562)."""
+    if name in _EXTRACTOR_MODULES:
+        extractor_class = _load_extractor_class(name)
+        globals()[name] = extractor_class
+        return extractor_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ExtractorRegistry:
     """Registry for file extractors."""
     
-    _extractors: Dict[str, Type[BaseExtractor]] = {
+    # Values are either extractor classes or the names of classes listed in
+    # _EXTRACTOR_MODULES, which are resolved the first time they are needed
+    _extractors: Dict[str, Union[str, Type[BaseExtractor]]] = {
         # Text files
-        '.txt': PlainTextExtractor,
-        '.md': PlainTextExtractor,
+        '.txt': 'PlainTextExtractor',
+        '.md': 'PlainTextExtractor',
         
         # PDF files
-        '.pdf': PDFExtractor,
+        '.pdf': 'PDFExtractor',
         
         # Office files
-        '.docx': DOCXExtractor,
-        '.pptx': PPTXExtractor,
+        '.docx': 'DOCXExtractor',
+        '.pptx': 'PPTXExtractor',
         
         # HWP files
-        '.hwp': HWPExtractor,
+        '.hwp': 'HWPExtractor',
         
         # Data files
-        '.csv': CSVExtractor,
-        '.json': JSONExtractor,
-        '.xlsx': ExcelExtractor,
+        '.csv': 'CSVExtractor',
+        '.json': 'JSONExtractor',
+        '.xlsx': 'ExcelExtractor',
     }
     
+    # Extractors are stateless, so a single instance per extension is shared
+    _instances: Dict[str, BaseExtractor] = {}
+    
     @classmethod
     def get_extractor(cls, file_extension: str) -> BaseExtractor:
         """
@@ -49,12 +80,22 @@ class ExtractorRegistry:
             ValueError: If no extractor is available for the file type
         """
         extension = file_extension.lower()
+        extractor = cls._instances.get(extension)
+        if extractor is not None:
+            return extractor
+        
         extractor_class = cls._extractors.get(extension)
         
         if extractor_class is None:
             raise ValueError(f"No extractor available for file type: {extension}")
         
-        return extractor_class()
+        if isinstance(extractor_class, str):
+            extractor_class = _load_extractor_class(extractor_class)
+            cls._extractors[extension] = extractor_class
+        
+        extractor = extractor_class()
+        cls._instances[extension] = extractor
+        return extractor
     
     @classmethod
     def is_extractable(cls, file_extension: str) -> bool:
@@ -1,8 +1,18 @@
 """Base extractor interface and common utilities."""
 
+import mmap
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+
+# Text files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Markers of the error text returned in place of content when extraction fails
+_IMPORT_ERROR_MARKER = " reading requires additional dependencies. Please install with: "
+_EXTRACTION_ERROR_PREFIXES = ("Error extracting content from ", "Error reading file: ")
 
 
 class BaseExtractor(ABC):
@@ -28,25 +38,46 @@ class BaseExtractor(ABC):
     @staticmethod
     def _read_text_file(file_path: Path, encoding: str = 'utf-8') -> str:
         """Read a plain text file with error handling."""
-        try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                return file.read()
-        except UnicodeDecodeError:
-            # Fallback to different encodings
-            for fallback_encoding in ['cp949', 'euc-kr', 'latin-1']:
-                try:
-                    with open(file_path, 'r', encoding=fallback_encoding) as file:
-                        return file.read()
-                except UnicodeDecodeError:
-                    continue
-            raise ValueError(f"Unable to decode file with any supported encoding: {file_path}")
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size >= _MMAP_THRESHOLD_BYTES:
+                # Decode large files from the page cache without first
+                # copying them into a bytes object
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return BaseExtractor._decode_text(data, file_path, encoding)
+            data = file.read()
+        return BaseExtractor._decode_text(data, file_path, encoding)
+    
+    @staticmethod
+    def _decode_text(data: Union[bytes, mmap.mmap], file_path: Path, encoding: str) -> str:
+        """Decode file contents, trying each supported encoding on the same buffer."""
+        for candidate_encoding in (encoding, 'cp949', 'euc-kr', 'latin-1'):
+            try:
+                text = str(data, candidate_encoding)
+            except UnicodeDecodeError:
+                continue
+            # Match the newline translation of text-mode open()
+            return text.replace('\r\n', '\n').replace('\r', '\n')
+        raise ValueError(f"Unable to decode file with any supported encoding: {file_path}")
     
     @staticmethod
     def _handle_import_error(library_name: str, install_command: str) -> str:
         """Generate a standardized import error message."""
-        return f"{library_name} reading requires additional dependencies. Please install with: {install_command}"
+        return f"{library_name}{_IMPORT_ERROR_MARKER}{install_command}"
     
     @staticmethod
     def _handle_extraction_error(file_path: Path, error: Exception) -> str:
         """Generate a standardized extraction error message."""
-        return f"Error extracting content from {file_path.name}: {str(error)}"
+        return f"{_EXTRACTION_ERROR_PREFIXES[0]}{file_path.name}: {str(error)}"
+    
+    @staticmethod
+    def is_error_message(text: str) -> bool:
+        """
+        Check whether extracted text is an error message rather than file content.
+        
+        Args:
+            text: Text returned by an extractor or InputMessageCreator
+            
+        Returns:
+            True if the text reports a missing dependency or a failed extraction
+        """
+        return text.startswith(_EXTRACTION_ERROR_PREFIXES) or _IMPORT_ERROR_MARKER in text
@@ -42,25 +42,39 @@ class ExcelExtractor(BaseExtractor):
         """Extract text from Excel files."""
         try:
             import openpyxl
-            workbook = openpyxl.load_workbook(file_path)
-            content_parts = []
-            
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                content_parts.append(f"Sheet: {sheet_name}")
-                
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = '\t'.join([
-                        str(cell) if cell is not None else '' 
-                        for cell in row
-                    ])
-                    if row_text.strip():  # Only add non-empty rows
-                        content_parts.append(row_text)
-                
-                content_parts.append("")  # Empty line between sheets
-            
-            return '\n'.join(content_parts).strip()
+            # Read-only mode streams rows instead of building every cell object.
+            # Formula cells keep their formula text, since workbooks written by
+            # other tools often have no cached results to read instead
+            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            try:
+                sheets = (
+                    (sheet_name, workbook[sheet_name].iter_rows(values_only=True))
+                    for sheet_name in workbook.sheetnames
+                )
+                return self._format_sheets(sheets)
+            finally:
+                workbook.close()
         except ImportError:
             return self._handle_import_error("Excel", "pip install openpyxl")
         except Exception as e:
             return self._handle_extraction_error(file_path, e)
+    
+    @staticmethod
+    def _format_sheets(sheets) -> str:
+        """Format (sheet_name, rows) pairs as tab-separated text."""
+        content_parts = []
+        
+        for sheet_name, rows in sheets:
+            content_parts.append(f"Sheet: {sheet_name}")
+            
+            for row in rows:
+                row_text = '\t'.join([
+                    str(cell) if cell is not None else ''
+                    for cell in row
+                ])
+                if row_text.strip():  # Only add non-empty rows
+                    content_parts.append(row_text)
+            
+            content_parts.append("")  # Empty line between sheets
+        
+        return '\n'.join(content_parts).strip()
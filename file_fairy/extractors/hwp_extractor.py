@@ -9,6 +9,33 @@ from typing import List
 from .base import BaseExtractor
 
 
+# Little-endian 32-bit record header: tag (10 bits), level (10), size (12)
+_RECORD_HEADER = struct.Struct("<I")
+
+# Pattern applied to every decoded text record, compiled once
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class _RemovedCharacterTable(dict):
+    """
+    str.translate table deleting Chinese and control characters.
+    
+    Entries are filled in the first time each code point is seen, so the
+    Unicode category lookup runs once per distinct character instead of
+    once per character of text.
+    """
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        is_removed = '\u4e00' <= char <= '\u9fff' or unicodedata.category(char)[0] == "C"
+        value = None if is_removed else codepoint
+        self[codepoint] = value
+        return value
+
+
+_REMOVED_CHARACTERS = _RemovedCharacterTable()
+
+
 class HWPExtractor(BaseExtractor):
     """
     HWP file text extractor that handles Korean word processor files.
@@ -19,7 +46,7 @@ class HWPExtractor(BaseExtractor):
     HWP_SUMMARY_SECTION = "\x05HwpSummaryInformation"
     SECTION_NAME_LENGTH = len("Section")
     BODYTEXT_SECTION = "BodyText"
-    HWP_TEXT_TAGS = [67]
+    HWP_TEXT_TAGS = frozenset({67})
 
     def extract(self, file_path: Path) -> str:
         """Extract text from HWP files."""
@@ -39,13 +66,14 @@ class HWPExtractor(BaseExtractor):
         is_compressed = self._is_compressed(ole_file)
         sections = self._get_body_sections(directories)
         
-        extracted_text = ""
-        for section in sections:
-            extracted_text += self._extract_section_text(ole_file, section, is_compressed)
-            extracted_text += "\n"
+        # Collect section texts and join once instead of rebuilding the string per section
+        section_texts = [
+            self._extract_section_text(ole_file, section, is_compressed)
+            for section in sections
+        ]
         
         ole_file.close()
-        return extracted_text.strip()
+        return "\n".join(section_texts).strip()
 
     def _load_ole_file(self, file_path: Path):
         """Load OLE file using olefile library."""
@@ -96,28 +124,29 @@ class HWPExtractor(BaseExtractor):
         """Parse section data to extract text content."""
         size = len(data)
         position = 0
-        text_content = ""
+        text_parts = []
         
-        while position < size:
-            try:
-                header = struct.unpack_from("<I", data, position)[0]
-                record_type = header & 0x3ff
-                record_length = (header >> 20) & 0xfff
+        # Bind lookups used on every record to locals
+        unpack_header = _RECORD_HEADER.unpack_from
+        text_tags = self.HWP_TEXT_TAGS
+        decode_record_data = self._decode_record_data
+        
+        # A trailing fragment shorter than a record header holds no record
+        last_header_position = size - _RECORD_HEADER.size
+        while position <= last_header_position:
+            header = unpack_header(data, position)[0]
+            record_type = header & 0x3ff
+            record_length = (header >> 20) & 0xfff
 
-                if record_type in self.HWP_TEXT_TAGS:
-                    record_data = data[position + 4:position + 4 + record_length]
-                    decoded_text = self._decode_record_data(record_data)
-                    if decoded_text:
-                        text_content += decoded_text + "\n"
+            if record_type in text_tags:
+                record_data = data[position + 4:position + 4 + record_length]
+                decoded_text = decode_record_data(record_data)
+                if decoded_text:
+                    text_parts.append(decoded_text)
 
-                position += 4 + record_length
-                
-            except (struct.error, IndexError):
-                # Skip problematic data and continue
-                position += 1
-                continue
+            position += 4 + record_length
 
-        return text_content
+        return "".join(f"{text}\n" for text in text_parts)
 
     def _decode_record_data(self, record_data: bytes) -> str:
         """Decode record data to text."""
@@ -129,13 +158,10 @@ class HWPExtractor(BaseExtractor):
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text by removing unwanted characters."""
-        # Remove Chinese characters
-        text = re.sub(r'[\u4e00-\u9fff]+', '', text)
-        
-        # Remove control characters
-        text = "".join(char for char in text if unicodedata.category(char)[0] != "C")
+        # Remove Chinese and control characters in a single translate pass
+        text = text.translate(_REMOVED_CHARACTERS)
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_PATTERN.sub(' ', text).strip()
         
         return text
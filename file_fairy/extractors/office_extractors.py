@@ -1,5 +1,7 @@
 """Extractor for Microsoft Office documents."""
 
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from .base import BaseExtractor
 
@@ -7,8 +9,26 @@ from .base import BaseExtractor
 class DOCXExtractor(BaseExtractor):
     """Extractor for DOCX files."""
     
+    # WordprocessingML element tags
+    WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    PARAGRAPH_TAG = WORD_NAMESPACE + "p"
+    TEXT_TAG = WORD_NAMESPACE + "t"
+    TAB_TAG = WORD_NAMESPACE + "tab"
+    BREAK_TAGS = (WORD_NAMESPACE + "br", WORD_NAMESPACE + "cr")
+    BREAK_TYPE_ATTRIBUTE = WORD_NAMESPACE + "type"
+    # Alternate content fallbacks duplicate the text of their preferred choice
+    FALLBACK_TAG = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+    
     def extract(self, file_path: Path) -> str:
         """Extract text from DOCX files."""
+        try:
+            return self._extract_document_xml(file_path)
+        except (KeyError, zipfile.BadZipFile, ET.ParseError):
+            # Not a plain WordprocessingML package; let python-docx try
+            pass
+        except Exception as e:
+            return self._handle_extraction_error(file_path, e)
+        
         try:
             from docx import Document
             doc = Document(file_path)
@@ -18,6 +38,45 @@ class DOCXExtractor(BaseExtractor):
             return self._handle_import_error("DOCX", "pip install python-docx")
         except Exception as e:
             return self._handle_extraction_error(file_path, e)
+    
+    def _extract_document_xml(self, file_path: Path) -> str:
+        """Stream paragraph text from word/document.xml without building a Document."""
+        paragraphs = []
+        # One text buffer per open paragraph; text boxes nest paragraphs inside runs
+        paragraph_parts = []
+        fallback_depth = 0
+        
+        with zipfile.ZipFile(file_path) as archive, archive.open("word/document.xml") as document:
+            for event, element in ET.iterparse(document, events=("start", "end")):
+                tag = element.tag
+                if tag == self.FALLBACK_TAG:
+                    fallback_depth += 1 if event == "start" else -1
+                    continue
+                if fallback_depth:
+                    continue
+                
+                if event == "start":
+                    if tag == self.PARAGRAPH_TAG:
+                        paragraph_parts.append([])
+                    continue
+                if not paragraph_parts:
+                    continue
+                
+                parts = paragraph_parts[-1]
+                if tag == self.TEXT_TAG:
+                    if element.text:
+                        parts.append(element.text)
+                elif tag == self.TAB_TAG:
+                    parts.append("\t")
+                elif tag in self.BREAK_TAGS:
+                    if element.get(self.BREAK_TYPE_ATTRIBUTE) in (None, "textWrapping"):
+                        parts.append("\n")
+                elif tag == self.PARAGRAPH_TAG:
+                    paragraphs.append("".join(paragraph_parts.pop()))
+                    # Release the parsed paragraph subtree
+                    element.clear()
+        
+        return '\n'.join(paragraphs)
 
 
 class PPTXExtractor(BaseExtractor):
@@ -32,8 +91,12 @@ class PPTXExtractor(BaseExtractor):
             
             for slide in presentation.slides:
                 for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text_content.append(shape.text)
+                    try:
+                        if shape.has_text_frame:
+                            text_content.append(shape.text_frame.text)
+                    except NotImplementedError:
+                        # Unrecognized shape types raise instead of reporting no text
+                        continue
             
             return '\n'.join(text_content)
         except ImportError:
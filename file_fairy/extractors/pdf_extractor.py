@@ -13,10 +13,9 @@ class PDFExtractor(BaseExtractor):
             import PyPDF2
             with open(file_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-                return text.strip()
+                return "\n".join(
+                    page.extract_text() or "" for page in reader.pages
+                ).strip()
         except ImportError:
             return self._handle_import_error("PDF", "pip install PyPDF2")
         except Exception as e:
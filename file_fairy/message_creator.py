@@ -1,7 +1,9 @@
 """Core message creation functionality."""
 
+import os
+import stat
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, FrozenSet, Optional
 
 from .constants import MessageTypes, Roles
 from .extractors import ExtractorRegistry
@@ -13,15 +15,47 @@ class InputMessageCreator:
     Handles text, image, audio, and data files and converts them into a standardized format.
     """
     
-    def __init__(self):
-        """Initialize the InputMessageCreator."""
-        self._extractor_registry = ExtractorRegistry()
+    # The registry only exposes classmethods, so it is shared rather than instantiated
+    _extractor_registry = ExtractorRegistry
+    _supported_extensions: Optional[FrozenSet[str]] = None
+    _content_handlers: Optional[Dict[str, Callable]] = None
     
     def _get_file_category(self):
         """Get FileCategory to avoid circular imports."""
         from .core.config import FileCategory
         return FileCategory
     
+    @staticmethod
+    def _get_extension(file_path: str) -> str:
+        """
+        Get the lowercase extension of a path, matching os.path.splitext.
+        
+        Uses plain string searches instead of splitext's per-call tuple.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Lowercase extension including the dot, or an empty string
+        """
+        path = os.fspath(file_path)
+        dot = path.rfind('.')
+        separator = path.rfind(os.sep)
+        if os.altsep:
+            separator = max(separator, path.rfind(os.altsep))
+        # No dot in the final component, or only leading dots (e.g. '.bashrc')
+        if dot <= separator + 1 or not path[separator + 1:dot].strip('.'):
+            return ''
+        return path[dot:].lower()
+    
+    def _get_supported_extensions(self) -> FrozenSet[str]:
+        """Get all supported extensions, built once on first use."""
+        cls = type(self)
+        if cls._supported_extensions is None:
+            FileCategory = self._get_file_category()
+            cls._supported_extensions = frozenset(FileCategory.get_all_extensions())
+        return cls._supported_extensions
+    
     def create_message(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Create a structured message from a file path.
@@ -34,19 +68,25 @@ class InputMessageCreator:
             
         Raises:
             FileNotFoundError: If the file doesn't exist
-            ValueError: If the file format is not supported
+            ValueError: If the file format is not supported or the path is a directory
         """
+        # Reject unsupported formats before touching the filesystem
+        file_extension = self._get_extension(file_path)
+        if file_extension not in self._get_supported_extensions():
+            raise ValueError(f"Unsupported file format: {file_extension}")
+        
         file_path_obj = Path(file_path)
         
-        if not file_path_obj.exists():
-            raise FileNotFoundError(f"File not found: {file_path_obj}")
+        # A single stat() both checks existence and rejects directories
+        try:
+            is_directory = stat.S_ISDIR(file_path_obj.stat().st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found: {file_path_obj}") from None
+        if is_directory:
+            raise ValueError(f"Not a file: {file_path_obj}")
         
-        file_extension = file_path_obj.suffix.lower()
         file_name = file_path_obj.name
         
-        if not self.is_supported_format(file_path):
-            raise ValueError(f"Unsupported file format: {file_extension}")
-        
         # Create content item based on file type
         content_item = self._create_content_item(file_path_obj, file_extension)
         
@@ -61,6 +101,28 @@ class InputMessageCreator:
             }
         ]
     
+    def _get_content_handlers(self) -> Dict[str, Callable]:
+        """Get the extension -> content item builder table, built once on first use."""
+        cls = type(self)
+        if cls._content_handlers is None:
+            FileCategory = self._get_file_category()
+            # Earlier categories win when an extension appears in several
+            category_handlers = [
+                (FileCategory.DOCUMENTS, cls._create_text_item),
+                (FileCategory.IMAGES, cls._create_image_item),
+                (FileCategory.AUDIO, cls._create_audio_item),
+                (FileCategory.DATA, cls._create_text_item),
+                (FileCategory.VIDEO, cls._create_image_item),  # Treat video as media
+                (FileCategory.ARCHIVES, cls._create_archive_item),
+                (FileCategory.CODE, cls._create_text_item),
+            ]
+            handlers = {}
+            for category, handler in category_handlers:
+                for extension in category.extensions:
+                    handlers.setdefault(extension, handler)
+            cls._content_handlers = handlers
+        return cls._content_handlers
+    
     def _create_content_item(self, file_path: Path, file_extension: str) -> Dict[str, str]:
         """
         Create the appropriate content item based on file type.
@@ -72,34 +134,27 @@ class InputMessageCreator:
         Returns:
             Content item with type and content
         """
-        FileCategory = self._get_file_category()
-        
-        if file_extension in FileCategory.DOCUMENTS.extensions:
-            text_content = self._extract_text_content(file_path, file_extension)
-            return {"type": MessageTypes.TEXT, "text": text_content}
-        
-        elif file_extension in FileCategory.IMAGES.extensions:
-            return {"type": MessageTypes.IMAGE, "path": str(file_path)}
-        
-        elif file_extension in FileCategory.AUDIO.extensions:
-            return {"type": MessageTypes.AUDIO, "path": str(file_path)}
-        
-        elif file_extension in FileCategory.DATA.extensions:
-            text_content = self._extract_text_content(file_path, file_extension)
-            return {"type": MessageTypes.TEXT, "text": text_content}
-        
-        elif file_extension in FileCategory.VIDEO.extensions:
-            return {"type": MessageTypes.IMAGE, "path": str(file_path)}  # Treat video as media
-        
-        elif file_extension in FileCategory.ARCHIVES.extensions:
-            return {"type": MessageTypes.TEXT, "text": f"Archive file: {file_path.name}"}
-        
-        elif file_extension in FileCategory.CODE.extensions:
-            text_content = self._extract_text_content(file_path, file_extension)
-            return {"type": MessageTypes.TEXT, "text": text_content}
-        
-        else:
+        handler = self._get_content_handlers().get(file_extension)
+        if handler is None:
             raise ValueError(f"Unsupported file format: {file_extension}")
+        return handler(self, file_path, file_extension)
+    
+    def _create_text_item(self, file_path: Path, file_extension: str) -> Dict[str, str]:
+        """Create a text item from the extracted file content."""
+        text_content = self._extract_text_content(file_path, file_extension)
+        return {"type": MessageTypes.TEXT, "text": text_content}
+    
+    def _create_image_item(self, file_path: Path, file_extension: str) -> Dict[str, str]:
+        """Create an image item referencing the file."""
+        return {"type": MessageTypes.IMAGE, "path": str(file_path)}
+    
+    def _create_audio_item(self, file_path: Path, file_extension: str) -> Dict[str, str]:
+        """Create an audio item referencing the file."""
+        return {"type": MessageTypes.AUDIO, "path": str(file_path)}
+    
+    def _create_archive_item(self, file_path: Path, file_extension: str) -> Dict[str, str]:
+        """Create a text item describing an archive file."""
+        return {"type": MessageTypes.TEXT, "text": f"Archive file: {file_path.name}"}
     
     def _extract_text_content(self, file_path: Path, file_extension: str) -> str:
         """
@@ -128,9 +183,8 @@ class InputMessageCreator:
         Returns:
             True if supported, False otherwise
         """
-        file_extension = Path(file_path).suffix.lower()
-        FileCategory = self._get_file_category()
-        return file_extension in FileCategory.get_all_extensions()
+        file_extension = self._get_extension(file_path)
+        return file_extension in self._get_supported_extensions()
     
     def get_supported_formats(self) -> Dict[str, List[str]]:
         """
@@ -2,7 +2,23 @@
 
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List
+
+
+# Words in filenames: runs of Korean, English letters and digits
+_FILENAME_WORD_PATTERN = re.compile(r'[가-힣A-Za-z0-9]+')
+
+# Characters that are unsafe in filenames, mapped to underscores
+_UNSAFE_FILENAME_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Runs of underscores collapsed by sanitize_filename
+_REPEATED_UNDERSCORES_PATTERN = re.compile(r'_+')
+
+# Extensions of files that are likely plain text
+_TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.rst', '.log', '.csv', '.json', '.xml', '.html', 
+    '.css', '.js', '.py', '.java', '.cpp', '.c', '.h', '.yaml', '.yml'
+})
 
 
 def sanitize_filename(filename: str) -> str:
@@ -15,18 +31,14 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace unsafe characters with underscores
-    unsafe_chars = '<>:"/\\|?*'
-    sanitized = filename
-    
-    for char in unsafe_chars:
-        sanitized = sanitized.replace(char, '_')
+    # Replace unsafe characters with underscores in a single pass
+    sanitized = filename.translate(_UNSAFE_FILENAME_CHARS_TABLE)
     
     # Remove leading/trailing dots and spaces
     sanitized = sanitized.strip('. ')
     
     # Replace multiple underscores with single underscore
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _REPEATED_UNDERSCORES_PATTERN.sub('_', sanitized)
     
     # Ensure it's not empty
     if not sanitized:
@@ -65,7 +77,7 @@ def extract_text_from_filename(filename: str) -> List[str]:
     stem = Path(filename).stem
     
     # Extract words (Korean, English, numbers)
-    words = re.findall(r'[가-힣A-Za-z0-9]+', stem)
+    words = _FILENAME_WORD_PATTERN.findall(stem)
     
     return words
 
@@ -120,9 +132,4 @@ def is_text_file(file_path: Path) -> bool:
     Returns:
         True if likely a text file, False otherwise
     """
-    text_extensions = {
-        '.txt', '.md', '.rst', '.log', '.csv', '.json', '.xml', '.html', 
-        '.css', '.js', '.py', '.java', '.cpp', '.c', '.h', '.yaml', '.yml'
-    }
-    
-    return file_path.suffix.lower() in text_extensions
+    return file_path.suffix.lower() in _TEXT_EXTENSIONS